@@ -2,6 +2,8 @@ from manim import *
 import numpy as np
 import os
 
+COLORS = (RED, BLUE, GREEN, YELLOW, PURPLE, ORANGE, PINK, GRAY, TEAL, MAROON)
+
 class IntermediateStressTest(Scene):
     """
     Intermediate stress test - Expected runtime: ~20 minutes
@@ -14,6 +16,10 @@ class IntermediateStressTest(Scene):
     - Higher frame rate and longer duration
     """
     
+    def setup(self):
+        # Seeded generator for every random draw (MANIM_STRESS_SEED, default 42)
+        self.rng = np.random.default_rng(int(os.getenv('MANIM_STRESS_SEED', 42)))
+    
     def construct(self):
         # Check if we're in test mode for fast verification
         test_mode = os.getenv('MANIM_TEST_MODE', 'false').lower() == 'true'
@@ -26,15 +32,13 @@ class IntermediateStressTest(Scene):
             self.wait(0.3)
             
             # Create fewer particles for fast test
-            particles = VGroup()
-            for i in range(12):  # Reduced from 80 to 12
-                particle = Dot(radius=0.08, color=random_color())
-                angle = i * 2 * PI / 12
-                radius = 2 * np.sqrt(np.random.random())
-                x = radius * np.cos(angle)
-                y = radius * np.sin(angle)
-                particle.move_to([x, y, 0])
-                particles.add(particle)
+            angles = np.arange(12) * 2 * PI / 12  # Reduced from 80 to 12
+            radii = 2 * np.sqrt(self.rng.random(12))
+            positions = np.column_stack([radii * np.cos(angles), radii * np.sin(angles), np.zeros(12)])
+            particles = VGroup(*[
+                Dot(radius=0.08, color=color).move_to(position)
+                for position, color in zip(positions, random_colors(12, self.rng))
+            ])
         else:
             # Normal test mode - full complexity
             title = Text("Intermediate Stress Test - Level 2", font_size=48, color=ORANGE)
@@ -43,22 +47,19 @@ class IntermediateStressTest(Scene):
             self.wait(1)
             
             # Create a moderate particle system
-            particles = VGroup()
-            for i in range(80):
-                particle = Dot(radius=0.05, color=random_color())
-                # Random position in a circle
-                angle = i * 2 * PI / 200
-                radius = 3 * np.sqrt(np.random.random())
-                x = radius * np.cos(angle)
-                y = radius * np.sin(angle)
-                particle.move_to([x, y, 0])
-                particles.add(particle)
+            # Random position in a circle
+            angles = np.arange(80) * 2 * PI / 200
+            radii = 3 * np.sqrt(self.rng.random(80))
+            positions = np.column_stack([radii * np.cos(angles), radii * np.sin(angles), np.zeros(80)])
+            particles = VGroup(*[
+                Dot(radius=0.05, color=color).move_to(position)
+                for position, color in zip(positions, random_colors(80, self.rng))
+            ])
         
         # Animate particles appearing with complex timing
         if test_mode:
             self.play(
-                LaggedStart(*[FadeIn(particle) for particle in particles], 
-                           lag_ratio=0.05),
+                FadeIn(particles, lag_ratio=0.05),
                 run_time=1
             )
             self.wait(0.2)
@@ -74,8 +75,7 @@ class IntermediateStressTest(Scene):
             )
         else:
             self.play(
-                LaggedStart(*[FadeIn(particle) for particle in particles], 
-                           lag_ratio=0.02),
+                FadeIn(particles, lag_ratio=0.02),
                 run_time=4
             )
             self.wait(1)
@@ -93,13 +93,15 @@ class IntermediateStressTest(Scene):
         
         if not test_mode:
             # Create a spiral motion (skip in test mode)
-            self.play(
-                *[particle.animate.shift(
-                    [0.1*np.cos(i*0.1 + self.renderer.time), 
-                     0.1*np.sin(i*0.1 + self.renderer.time), 0]
-                ) for i, particle in enumerate(particles)],
-                run_time=5
-            )
+            phases = 0.1 * np.arange(len(particles)) + self.renderer.time
+            start_positions = np.array([particle.get_center() for particle in particles])
+            offsets = 0.1 * np.column_stack([np.cos(phases), np.sin(phases), np.zeros_like(phases)])
+            
+            def spiral(group, alpha):
+                for particle, position in zip(group, start_positions + alpha * offsets):
+                    particle.move_to(position)
+            
+            self.play(UpdateFromAlphaFunc(particles, spiral), run_time=5)
         
         # Mathematical visualization (simplified in test mode)
         self.play(FadeOut(particles), run_time=0.5 if test_mode else 1)
@@ -125,18 +127,17 @@ class IntermediateStressTest(Scene):
                 axis_config={"color": BLUE},
             )
             
-            # Create multiple sine waves
-            waves = VGroup()
-            for n in range(1, 10, 2):  # Fewer harmonics
-                wave = axes.plot(
-                    lambda x, n=n: (4/PI) * np.sin(n*x) / n,
-                    color=interpolate_color(RED, YELLOW, n/20)
-                )
-                waves.add(wave)
+            # Create multiple sine waves, each harmonic sampled once
+            xs = np.linspace(-4, 4, 400)
+            harmonics = {n: (4/PI) * np.sin(n*xs) / n for n in range(1, 10, 2)}  # Fewer harmonics
+            waves = VGroup(*[
+                sampled_plot(axes, xs, ys, color=interpolate_color(RED, YELLOW, n/20))
+                for n, ys in harmonics.items()
+            ])
             
             # Fourier series sum
-            fourier_sum = axes.plot(
-                lambda x: sum((4/PI) * np.sin(n*x) / n for n in range(1, 10, 2)),
+            fourier_sum = sampled_plot(
+                axes, xs, sum(harmonics.values()),
                 color=WHITE,
                 stroke_width=6
             )
@@ -159,21 +160,18 @@ class IntermediateStressTest(Scene):
             self.wait(0.5)
         else:
             # 3D visualization
-            self.remove(*self.mobjects)
+            self.clear()
             
             # Create 3D surface
-            surface_points = []
-            for u in np.linspace(-2, 2, 20):
-                for v in np.linspace(-2, 2, 20):
-                    x = u
-                    y = v
-                    z = 0.5 * (np.sin(u**2 + v**2) * np.exp(-0.1*(u**2 + v**2)))
-                    surface_points.append([x, y, z])
+            u, v = np.meshgrid(np.linspace(-2, 2, 20), np.linspace(-2, 2, 20), indexing='ij')
+            z = 0.5 * (np.sin(u**2 + v**2) * np.exp(-0.1*(u**2 + v**2)))
+            surface_points = np.stack([u.ravel(), v.ravel(), z.ravel()], axis=1)
+            palette = color_gradient([BLUE, GREEN, RED], len(surface_points))
             
             # Create dots for 3D surface
             surface_dots = VGroup()
-            for point in surface_points[::2]:  # Skip some points for performance
-                dot = Dot3D(point=point, color=color_gradient([BLUE, GREEN, RED], len(surface_points))[surface_points.index(point) % len(surface_points)])
+            for index in range(0, len(surface_points), 2):  # Skip some points for performance
+                dot = Dot3D(point=surface_points[index], color=palette[index])
                 surface_dots.add(dot)
             
             # Animate 3D surface
@@ -190,10 +188,10 @@ class IntermediateStressTest(Scene):
                 )
             
             # Complex color animations
-            self.play(
-                *[dot.animate.set_color(random_color()) for dot in surface_dots],
-                run_time=3
-            )
+            surface_dots.generate_target()
+            for dot, color in zip(surface_dots.target, random_colors(len(surface_dots), self.rng)):
+                dot.set_color(color)
+            self.play(MoveToTarget(surface_dots), run_time=3)
             
             # Final cleanup
             self.play(FadeOut(Group(*self.mobjects)), run_time=3)
@@ -203,7 +201,12 @@ class IntermediateStressTest(Scene):
             self.play(Write(final_text), run_time=2)
             self.wait(3)
 
-def random_color():
-    """Generate a random color"""
-    colors = [RED, BLUE, GREEN, YELLOW, PURPLE, ORANGE, PINK, GRAY, TEAL, MAROON]
-    return np.random.choice(colors)
+def sampled_plot(axes, xs, ys, **kwargs):
+    """Plot precomputed samples on axes as a smooth curve"""
+    graph = VMobject(**kwargs)
+    graph.set_points_smoothly(axes.coords_to_point(np.column_stack([xs, ys])))
+    return graph
+
+def random_colors(count, rng):
+    """Generate count random colors with a single draw"""
+    return [COLORS[i] for i in rng.integers(len(COLORS), size=count)]
@@ -4,9 +4,18 @@ import sys
 import os
 import threading
 import argparse
+import re
+import codecs
+import asyncio
 from datetime import datetime
 
-def run_manim_scene(file_path, scene_name, quality="m", log_interval=15, test_mode=False):
+# Manim quality folder names are like 1080p60, 720p30 etc.
+QUALITY_FOLDERS = {'l': '480p15', 'm': '720p30', 'h': '1080p60', 'p': '1440p60', 'k': '2160p60'}
+
+# Extended cool down ends early once the CPU is at or below this temperature
+COOL_DOWN_TARGET_C = 60
+
+def run_manim_scene(file_path, scene_name, quality="m", log_interval=15, test_mode=False, workers=1):
     """Run a manim scene and measure performance with concise logging"""
     print(f"\n{'='*60}")
     print(f"STARTING: {scene_name} (Quality: {quality})")
@@ -15,12 +24,12 @@ def run_manim_scene(file_path, scene_name, quality="m", log_interval=15, test_mo
     print(f"{'='*60}")
     
     start_time = time.time()
-    last_log_time = start_time
     
     # Set FFmpeg path and test mode environment
     ffmpeg_path = os.path.join(os.getcwd(), "ffmpeg-7.1.1-essentials_build", "bin")
     env = os.environ.copy()
-    env["PATH"] = ffmpeg_path + ";" + env.get("PATH", "")
+    if os.path.isdir(ffmpeg_path):
+        env["PATH"] = os.pathsep.join([ffmpeg_path, env.get("PATH", "")])
     
     # Set test mode environment variable for the stress test scripts
     if test_mode:
@@ -42,63 +51,25 @@ def run_manim_scene(file_path, scene_name, quality="m", log_interval=15, test_mo
         print(f"Command: {' '.join(cmd[:4])} ... {scene_name}")
         print("Progress: Starting render...")
         
-        # Run with minimal output monitoring
-        process = subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            env=env,
-            universal_newlines=True,
-            bufsize=1
-        )
-        
-        # Monitor with periodic time updates (non-blocking)
-        frame_count = 0
-        output_buffer = []
-        
-        def read_output():
-            """Read output in a separate thread to avoid blocking"""
-            try:
-                for line in iter(process.stdout.readline, ''):
-                    if line:
-                        output_buffer.append(line)
-                    else:
-                        break
-            except:
-                pass
-        
-        # Start output reading thread
-        output_thread = threading.Thread(target=read_output)
-        output_thread.daemon = True
-        output_thread.start()
-        
-        # Main monitoring loop with guaranteed periodic updates
-        while process.poll() is None:
-            current_time = time.time()
-            
-            # Process any buffered output
-            while output_buffer:
-                output = output_buffer.pop(0)
-                if output and ('INFO' in output or 'frame' in output.lower()):
-                    frame_count += 1
-                    if frame_count % 50 == 0:  # Every 50 frames
-                        elapsed = current_time - start_time
-                        print(f"Progress: {elapsed/60:.1f} min - {frame_count} operations completed")
-            
-            # Log progress every log_interval seconds (guaranteed to run)
-            if current_time - last_log_time >= log_interval:
-                elapsed = current_time - start_time
-                print(f"Progress: {elapsed/60:.1f} min elapsed - Still rendering...")
-                last_log_time = current_time
+        # Split the render across worker processes when requested
+        animation_ranges = []
+        if workers > 1:
+            # Every worker (and the dry run) is a separate process that rebuilds the
+            # scene from scratch; each scene seeds its generator from this variable,
+            # so a shared value makes all of them build the same random scene
+            env.setdefault("MANIM_STRESS_SEED", str(int(start_time)))
+            print(f"Workers: Random seed {env['MANIM_STRESS_SEED']}")
+            num_animations = count_animations(cmd, env, log_interval)
+            animation_ranges = split_animation_ranges(num_animations, workers)
+            if len(animation_ranges) < 2:
+                print("Workers: Could not partition the scene, rendering in a single process")
+        
+        if len(animation_ranges) > 1:
+            returncode = render_partitioned(cmd, file_path, scene_name, quality, animation_ranges, env, log_interval)
+        else:
+            # Run the render and drain its output on a single event loop
+            returncode = asyncio.run(stream_render(cmd, env, start_time, log_interval))
             
-            # Sleep briefly to prevent busy waiting
-            time.sleep(0.5)
-        
-        # Wait for process to complete and output thread to finish
-        process.wait()
-        output_thread.join(timeout=1)
-        
         end_time = time.time()
         duration = end_time - start_time
         
@@ -107,15 +78,13 @@ def run_manim_scene(file_path, scene_name, quality="m", log_interval=15, test_mo
         print(f"End: {datetime.now().strftime('%H:%M:%S')}")
         print(f"Duration: {duration/60:.1f} minutes ({duration:.0f} seconds)")
         
-        if process.returncode == 0:
+        if returncode == 0:
             print("Status: SUCCESS")
             
             # Check for the specific output file
             # Manim's default output is media/videos/{script_name}/{quality}/{scene_name}.mp4
             script_name_no_ext = os.path.splitext(os.path.basename(file_path))[0]
-            # Manim quality folder names are like 1080p60, 720p30 etc. Let's check for the most common ones.
-            quality_map = {'l': '480p15', 'm': '720p30', 'h': '1080p60', 'p': '1440p60', 'k': '2160p60'}
-            quality_folder = quality_map.get(quality, '720p30')
+            quality_folder = QUALITY_FOLDERS.get(quality, '720p30')
             
             expected_file_path = os.path.join(os.getcwd(), "media", "videos", script_name_no_ext, quality_folder, f"{scene_name}.mp4")
             partial_dir = os.path.join(os.getcwd(), "media", "videos", script_name_no_ext, quality_folder, "partial_movie_files", scene_name)
@@ -137,15 +106,215 @@ def run_manim_scene(file_path, scene_name, quality="m", log_interval=15, test_mo
             else:
                 print(f"Output: Video file not found at expected path: {expected_file_path}")
         else:
-            print(f"Status: FAILED (Exit code: {process.returncode})")
+            print(f"Status: FAILED (Exit code: {returncode})")
         
         print(f"{'='*60}")
-        return duration, process.returncode == 0
+        return duration, returncode == 0
         
     except Exception as e:
         print(f"ERROR: {str(e)}")
         return None, False
 
+async def stream_render(cmd, env, start_time, log_interval):
+    """Run a render, draining its output and logging progress until it exits"""
+    process = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
+        env=env
+    )
+    
+    frame_count = 0
+    last_log_time = start_time
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+    pending = ''
+    
+    while True:
+        # Wake on new output or when the next log is due, never in between
+        timeout = max(0, last_log_time + log_interval - time.time())
+        try:
+            data = await asyncio.wait_for(process.stdout.read(65536), timeout=timeout)
+        except asyncio.TimeoutError:
+            data = None
+        
+        if data is not None:
+            if not data:
+                break
+            # Progress bars redraw with carriage returns, so split on those too
+            *lines, pending = re.split(r'\r\n|\r|\n', pending + decoder.decode(data))
+            for output in lines:
+                if 'INFO' in output or 'frame' in output.lower():
+                    frame_count += 1
+                    if frame_count % 50 == 0:  # Every 50 frames
+                        elapsed = time.time() - start_time
+                        print(f"Progress: {elapsed/60:.1f} min - {frame_count} operations completed")
+        
+        # Log progress every log_interval seconds (guaranteed to run)
+        current_time = time.time()
+        if current_time - last_log_time >= log_interval:
+            elapsed = current_time - start_time
+            print(f"Progress: {elapsed/60:.1f} min elapsed - Still rendering...")
+            last_log_time = current_time
+    
+    return await process.wait()
+
+def log_periodically(log_interval, log_progress):
+    """Call log_progress every log_interval seconds from a timer; returns a stop function"""
+    stopped = threading.Event()
+    timer = None
+    
+    def tick():
+        if not stopped.is_set():
+            log_progress()
+            schedule()
+    
+    def schedule():
+        nonlocal timer
+        timer = threading.Timer(log_interval, tick)
+        timer.daemon = True
+        timer.start()
+    
+    def stop():
+        stopped.set()
+        timer.cancel()
+    
+    schedule()
+    return stop
+
+def count_animations(cmd, env, log_interval):
+    """Count the animations of a scene with a manim dry run (0 if unknown)"""
+    dry_run_cmd = cmd[:-2] + ["--dry_run"] + cmd[-2:]
+    print("Workers: Counting animations with a dry run...")
+    start_time = time.time()
+    
+    def log_progress():
+        elapsed = time.time() - start_time
+        print(f"Progress: {elapsed/60:.1f} min elapsed - Still counting animations...")
+    
+    stop_logging = log_periodically(log_interval, log_progress)
+    try:
+        result = subprocess.run(dry_run_cmd, capture_output=True, text=True, env=env)
+    finally:
+        stop_logging()
+    match = re.search(r"Played (\d+) animations", result.stdout + result.stderr)
+    if result.returncode != 0 or not match:
+        return 0
+    return int(match.group(1))
+
+def split_animation_ranges(num_animations, workers):
+    """Split animation numbers into contiguous inclusive (first, last) ranges"""
+    chunk_size, remainder = divmod(num_animations, workers)
+    ranges = []
+    first = 0
+    for index in range(workers):
+        count = chunk_size + (1 if index < remainder else 0)
+        if count:
+            ranges.append((first, first + count - 1))
+        first += count
+    return ranges
+
+def render_partitioned(cmd, file_path, scene_name, quality, animation_ranges, env, log_interval):
+    """Render animation ranges in parallel manim processes and join the segments"""
+    script_name_no_ext = os.path.splitext(os.path.basename(file_path))[0]
+    quality_folder = QUALITY_FOLDERS.get(quality, '720p30')
+    workers_dir = os.path.join(os.getcwd(), "media", "workers", script_name_no_ext)
+    
+    print(f"Workers: Rendering {animation_ranges[-1][1] + 1} animations in {len(animation_ranges)} processes")
+    start_time = time.time()
+    
+    # Each worker renders its range into its own media directory
+    workers = []
+    segment_paths = []
+    for index, (first, last) in enumerate(animation_ranges):
+        media_dir = os.path.join(workers_dir, str(index))
+        os.makedirs(media_dir, exist_ok=True)
+        worker_cmd = cmd[:-2] + [
+            "--media_dir", media_dir,
+            "--from_animation_number", f"{first},{last}",
+        ] + cmd[-2:]
+        log_file = open(os.path.join(media_dir, "render.log"), 'w', encoding='utf-8')
+        process = subprocess.Popen(worker_cmd, stdout=log_file, stderr=subprocess.STDOUT, text=True, env=env)
+        workers.append((process, log_file))
+        segment_paths.append(os.path.join(media_dir, "videos", script_name_no_ext, quality_folder, f"{scene_name}.mp4"))
+    
+    def log_progress():
+        elapsed = time.time() - start_time
+        finished = sum(1 for worker, _ in workers if worker.poll() is not None)
+        print(f"Progress: {elapsed/60:.1f} min elapsed - {finished}/{len(workers)} segments rendered")
+    
+    # Block in wait() on each worker in turn while a timer logs progress
+    stop_logging = log_periodically(log_interval, log_progress)
+    try:
+        for process, log_file in workers:
+            process.wait()
+            log_file.close()
+    finally:
+        stop_logging()
+    
+    for index, (process, _) in enumerate(workers):
+        if process.returncode != 0:
+            print(f"Worker {index} failed, see {os.path.join(workers_dir, str(index), 'render.log')}")
+            return process.returncode
+    
+    output_path = os.path.join(os.getcwd(), "media", "videos", script_name_no_ext, quality_folder, f"{scene_name}.mp4")
+    print(f"Joining {len(segment_paths)} rendered segments...")
+    if not concat_videos(segment_paths, os.path.join(workers_dir, 'file_list.txt'), output_path):
+        return 1
+    return 0
+
+def concat_videos(video_paths, file_list_path, output_path):
+    """Concatenate video files with FFmpeg's concat demuxer"""
+    # Create file list for FFmpeg with absolute paths
+    with open(file_list_path, 'w', encoding='utf-8') as f:
+        for file_path in video_paths:
+            # Convert to absolute path and use forward slashes for FFmpeg
+            abs_path = os.path.abspath(file_path)
+            escaped_path = abs_path.replace('\\', '/').replace("'", "\\'")
+            f.write(f"file '{escaped_path}'\n")
+    
+    print(f"Created file list: {file_list_path}")
+    
+    # Get FFmpeg path
+    ffmpeg_path = os.path.join(os.getcwd(), "ffmpeg-7.1.1-essentials_build", "bin", "ffmpeg.exe")
+    if not os.path.exists(ffmpeg_path):
+        # Try system FFmpeg
+        ffmpeg_path = "ffmpeg"
+    
+    # Ensure output directory exists
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    
+    # Run FFmpeg consolidation
+    ffmpeg_cmd = [
+        ffmpeg_path,
+        '-f', 'concat',
+        '-safe', '0',
+        '-i', file_list_path,
+        '-c', 'copy',
+        '-y',  # Overwrite output file
+        output_path
+    ]
+    
+    print(f"Running FFmpeg consolidation...")
+    print(f"Command: {' '.join(ffmpeg_cmd)}")
+    
+    result = subprocess.run(
+        ffmpeg_cmd,
+        capture_output=True,
+        text=True,
+        cwd=os.getcwd()
+    )
+    
+    if result.returncode != 0:
+        print(f"ERROR: FFmpeg consolidation failed:")
+        print(f"Exit code: {result.returncode}")
+        print(f"Error: {result.stderr}")
+        if result.stdout:
+            print(f"Output: {result.stdout}")
+        return False
+    
+    print("SUCCESS: FFmpeg consolidation completed successfully!")
+    return True
+
 def consolidate_partial_videos(partial_dir, output_path, scene_name):
     """Consolidate partial video files using FFmpeg"""
     try:
@@ -162,76 +331,74 @@ def consolidate_partial_videos(partial_dir, output_path, scene_name):
         
         print(f"Found {len(partial_files)} partial video files to consolidate")
         
-        # Create file list for FFmpeg with absolute paths
         file_list_path = os.path.join(partial_dir, 'file_list.txt')
-        with open(file_list_path, 'w', encoding='utf-8') as f:
-            for file_path in partial_files:
-                # Convert to absolute path and use forward slashes for FFmpeg
-                abs_path = os.path.abspath(file_path)
-                escaped_path = abs_path.replace('\\', '/').replace("'", "\\'")
-                f.write(f"file '{escaped_path}'\n")
-        
-        print(f"Created file list: {file_list_path}")
-        
-        # Get FFmpeg path
-        ffmpeg_path = os.path.join(os.getcwd(), "ffmpeg-7.1.1-essentials_build", "bin", "ffmpeg.exe")
-        if not os.path.exists(ffmpeg_path):
-            # Try system FFmpeg
-            ffmpeg_path = "ffmpeg"
-        
-        # Ensure output directory exists
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        
-        # Run FFmpeg consolidation
-        ffmpeg_cmd = [
-            ffmpeg_path,
-            '-f', 'concat',
-            '-safe', '0',
-            '-i', file_list_path,
-            '-c', 'copy',
-            '-y',  # Overwrite output file
-            output_path
-        ]
-        
-        print(f"Running FFmpeg consolidation...")
-        print(f"Command: {' '.join(ffmpeg_cmd)}")
-        
-        result = subprocess.run(
-            ffmpeg_cmd,
-            capture_output=True,
-            text=True,
-            cwd=os.getcwd()
-        )
-        
-        if result.returncode == 0:
-            print("SUCCESS: FFmpeg consolidation completed successfully!")
-            
-            # Clean up partial files and file list
-            try:
-                os.remove(file_list_path)
-                for file_path in partial_files:
-                    if os.path.exists(file_path):
-                        os.remove(file_path)
-                # Remove partial directory if empty
-                if os.path.exists(partial_dir) and not os.listdir(partial_dir):
-                    os.rmdir(partial_dir)
-                print("INFO: Cleaned up partial files")
-            except Exception as cleanup_error:
-                print(f"WARNING: Could not clean up partial files: {cleanup_error}")
-            
-            return True
-        else:
-            print(f"ERROR: FFmpeg consolidation failed:")
-            print(f"Exit code: {result.returncode}")
-            print(f"Error: {result.stderr}")
-            if result.stdout:
-                print(f"Output: {result.stdout}")
+        if not concat_videos(partial_files, file_list_path, output_path):
             return False
+        
+        # Clean up partial files and file list
+        try:
+            os.remove(file_list_path)
+            for file_path in partial_files:
+                if os.path.exists(file_path):
+                    os.remove(file_path)
+            # Remove partial directory if empty
+            if os.path.exists(partial_dir) and not os.listdir(partial_dir):
+                os.rmdir(partial_dir)
+            print("INFO: Cleaned up partial files")
+        except Exception as cleanup_error:
+            print(f"WARNING: Could not clean up partial files: {cleanup_error}")
+        
+        return True
             
     except Exception as e:
         print(f"ERROR: Error during FFmpeg consolidation: {str(e)}")
         return False
 
+def read_cpu_temperature():
+    """Read the CPU temperature in Celsius, or None if no sensor is available"""
+    try:
+        if sys.platform.startswith('linux'):
+            with open('/sys/class/thermal/thermal_zone0/temp', encoding='utf-8') as f:
+                return int(f.read().strip()) / 1000  # Millidegrees
+        if sys.platform == 'win32':
+            result = subprocess.run(
+                ['wmic', '/namespace:\\\\root\\wmi', 'PATH', 'MSAcpi_ThermalZoneTemperature',
+                 'get', 'CurrentTemperature', '/value'],
+                capture_output=True, text=True, timeout=10
+            )
+            match = re.search(r"CurrentTemperature=(\d+)", result.stdout)
+            if match:
+                return int(match.group(1)) / 10 - 273.15  # Tenths of a kelvin
+    except (OSError, ValueError, subprocess.SubprocessError):
+        pass
+    return None
+
+def cool_down(max_seconds=300, check_interval=10):
+    """Wait until the CPU cools to COOL_DOWN_TARGET_C, or for max_seconds without a sensor"""
+    start_time = time.time()
+    temperature = read_cpu_temperature()
+    if temperature is None:
+        print(f"No temperature sensor available, cooling for the full {max_seconds // 60} minutes")
+        check_interval = 30
+    
+    while True:
+        remaining = max_seconds - (time.time() - start_time)
+        if remaining <= 0:
+            break
+        if temperature is not None and temperature <= COOL_DOWN_TARGET_C:
+            print(f"CPU at {temperature:.0f}C (target {COOL_DOWN_TARGET_C}C)")
+            break
+        
+        minutes, seconds = divmod(int(round(remaining)), 60)
+        status = f" - CPU at {temperature:.0f}C" if temperature is not None else ""
+        if minutes > 0:
+            print(f"Cooling time remaining: {minutes}m {seconds:02d}s{status}")
+        else:
+            print(f"Cooling time remaining: {seconds}s{status}")
+        time.sleep(min(check_interval, remaining))
+        if temperature is not None:
+            temperature = read_cpu_temperature()
+
 def save_report(results, start_time_str, end_time_str, test_names=None):
     """Save final test report to file"""
     # Include test difficulty in filename
@@ -306,6 +473,8 @@ def main():
                        help='Logging interval in seconds (default: 15)')
     parser.add_argument('--test-mode', action='store_true', 
                        help='Run fast test versions for quick script verification (~30 seconds each)')
+    parser.add_argument('--workers', type=int, default=1,
+                       help='Render each test in N parallel processes over disjoint animation ranges (default: 1)')
     
     args = parser.parse_args()
     
@@ -313,6 +482,8 @@ def main():
     print(f"Test Selection: {args.test}")
     print(f"Quality: {args.quality}")
     print(f"Log Interval: {args.log_interval}s")
+    if args.workers > 1:
+        print(f"Workers: {args.workers} parallel render processes per test")
     if args.test_mode:
         print("TEST MODE: Fast verification runs enabled")
     
@@ -354,7 +525,7 @@ def main():
                 file_path, scene_name, expected_duration = tests[test_name]
                 print(f"\n*** Running {test_name.upper()} Test ***")
                 
-                duration, success = run_manim_scene(file_path, scene_name, args.quality, args.log_interval, args.test_mode)
+                duration, success = run_manim_scene(file_path, scene_name, args.quality, args.log_interval, args.test_mode, args.workers)
                 results[test_name.capitalize()] = {
                     "duration": duration, 
                     "success": success, 
@@ -370,18 +541,10 @@ def main():
                         print(f"\n{'='*70}")
                         print("THERMAL MANAGEMENT - Extended Cool Down")
                         print(f"{'='*70}")
-                        print("Allowing system to cool for 5 minutes before next test...")
+                        print(f"Allowing system to cool to {COOL_DOWN_TARGET_C}C (up to 5 minutes) before next test...")
                         print("This helps prevent overheating during intensive stress testing.")
                         
-                        # 5-minute countdown with progress updates
-                        for remaining in range(300, 0, -30):  # Count down in 30-second intervals
-                            minutes = remaining // 60
-                            seconds = remaining % 60
-                            if minutes > 0:
-                                print(f"Cooling time remaining: {minutes}m {seconds:02d}s")
-                            else:
-                                print(f"Cooling time remaining: {seconds}s")
-                            time.sleep(30)
+                        cool_down()
                         
                         print("System cooling complete. Ready for next test.\n")
                     else:
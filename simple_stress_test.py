@@ -2,6 +2,8 @@ from manim import *
 import numpy as np
 import os
 
+COLORS = (RED, BLUE, GREEN, YELLOW, PURPLE, ORANGE, PINK, GRAY)
+
 class SimpleStressTest(Scene):
     """
     Simple stress test - Expected runtime: ~5 minutes
@@ -14,6 +16,10 @@ class SimpleStressTest(Scene):
     - Moderate frame count for reasonable render time
     """
     
+    def setup(self):
+        # Seeded generator for every random draw (MANIM_STRESS_SEED, default 42)
+        self.rng = np.random.default_rng(int(os.getenv('MANIM_STRESS_SEED', 42)))
+    
     def construct(self):
         # Check if we're in test mode for fast verification
         test_mode = os.getenv('MANIM_TEST_MODE', 'false').lower() == 'true'
@@ -26,12 +32,12 @@ class SimpleStressTest(Scene):
             self.wait(0.5)
             
             # Create fewer circles for fast test
-            circles = VGroup()
-            for i in range(3):  # Reduced from 10x5 to 3x2
-                for j in range(2):
-                    circle = Circle(radius=0.3, color=random_color())
-                    circle.move_to([i*1.5 - 1.5, j*1.0 - 0.5, 0])
-                    circles.add(circle)
+            i, j = np.meshgrid(np.arange(3), np.arange(2), indexing='ij')  # Reduced from 10x5 to 3x2
+            positions = np.stack([i*1.5 - 1.5, j*1.0 - 0.5, np.zeros_like(i)], axis=-1).reshape(-1, 3)
+            circles = VGroup(*[
+                Circle(radius=0.3, color=color).move_to(position)
+                for position, color in zip(positions, random_colors(len(positions), self.rng))
+            ])
         else:
             # Normal test mode - full complexity
             title = Text("Simple Stress Test - Level 1", font_size=48, color=BLUE)
@@ -40,16 +46,16 @@ class SimpleStressTest(Scene):
             self.wait(1)
             
             # Create a grid of circles with animations
-            circles = VGroup()
-            for i in range(10):
-                for j in range(5):
-                    circle = Circle(radius=0.2, color=random_color())
-                    circle.move_to([i*0.8 - 3.6, j*0.6 - 1.2, 0])
-                    circles.add(circle)
+            i, j = np.meshgrid(np.arange(10), np.arange(5), indexing='ij')
+            positions = np.stack([i*0.8 - 3.6, j*0.6 - 1.2, np.zeros_like(i)], axis=-1).reshape(-1, 3)
+            circles = VGroup(*[
+                Circle(radius=0.2, color=color).move_to(position)
+                for position, color in zip(positions, random_colors(len(positions), self.rng))
+            ])
         
         # Animate circles appearing
         if test_mode:
-            self.play(LaggedStart(*[Create(circle) for circle in circles], lag_ratio=0.05), run_time=1)
+            self.play(Create(circles, lag_ratio=0.05), run_time=1)
             self.wait(0.2)
             
             # Quick rotate
@@ -62,13 +68,10 @@ class SimpleStressTest(Scene):
             self.wait(0.2)
             
             # Quick color transformation
-            self.play(
-                *[circle.animate.set_color(YELLOW) for circle in circles],
-                run_time=1
-            )
+            self.play(circles.animate.set_color(YELLOW), run_time=1)
             self.wait(0.2)
         else:
-            self.play(LaggedStart(*[Create(circle) for circle in circles], lag_ratio=0.1))
+            self.play(Create(circles, lag_ratio=0.1))
             self.wait(1)
             
             # Rotate all circles
@@ -81,10 +84,7 @@ class SimpleStressTest(Scene):
             self.wait(1)
             
             # Color transformation
-            self.play(
-                *[circle.animate.set_color(YELLOW) for circle in circles],
-                run_time=3
-            )
+            self.play(circles.animate.set_color(YELLOW), run_time=3)
             self.wait(1)
         
         if test_mode:
@@ -116,7 +116,6 @@ class SimpleStressTest(Scene):
             self.play(Write(final_text))
             self.wait(2)
 
-def random_color():
-    """Generate a random color"""
-    colors = [RED, BLUE, GREEN, YELLOW, PURPLE, ORANGE, PINK, GRAY]
-    return np.random.choice(colors)
+def random_colors(count, rng):
+    """Generate count random colors with a single draw"""
+    return [COLORS[i] for i in rng.integers(len(COLORS), size=count)]
@@ -1,6 +1,73 @@
 from manim import *
 import numpy as np
 import os
+from scipy.spatial.transform import Rotation
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; kernels then run as plain Python
+    prange = range
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+try:
+    import cupy as cp
+    # Raises CUDARuntimeError when there is no usable driver
+    if cp.cuda.runtime.getDeviceCount() == 0:
+        cp = None
+except Exception:  # CuPy and a CUDA device are optional; the fractal grid then runs on the numba kernel
+    cp = None
+
+# Color lookup tables: values below bins[0] get colors[0], and so on
+SPEED_BINS = np.array([0.1, 0.5, 1.0])
+SPEED_COLORS = (BLUE, GREEN, YELLOW, RED)
+HEIGHT_BINS = np.array([-0.5, 0.0, 0.5])
+HEIGHT_COLORS = (DARK_BLUE, BLUE, GREEN, RED)
+TEMPERATURE_COLORS = (BLUE, PURPLE, RED, ORANGE, YELLOW, WHITE)
+
+COLORS = (RED, BLUE, GREEN, YELLOW, PURPLE, ORANGE, PINK, GRAY,
+          TEAL, MAROON, GOLD, LIGHT_BLUE, LIGHT_GREEN, LIGHT_PINK)
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def mandel_grid(width, height, max_iter, scale, cx, cy):
+    """Compute Mandelbrot escape iterations for every cell of a grid"""
+    out = np.empty((width, height), np.int32)
+    
+    for i in prange(width):
+        for j in range(height):
+            x = (i - cx) * scale
+            y = (j - cy) * scale
+            zr = 0.0
+            zi = 0.0
+            iterations = 0
+            while zr*zr + zi*zi <= 4.0 and iterations < max_iter:
+                zr, zi = zr*zr - zi*zi + x, 2*zr*zi + y
+                iterations += 1
+            out[i, j] = iterations
+    
+    return out
+
+
+def mandel_grid_gpu(width, height, max_iter, scale, cx, cy):
+    """Compute the same escape iterations as mandel_grid with CuPy on the GPU"""
+    x = (cp.arange(width) - cx) * scale
+    y = (cp.arange(height) - cy) * scale
+    c = x[:, None] + 1j * y[None, :]
+    z = cp.zeros_like(c)
+    out = cp.zeros(c.shape, cp.int32)
+    
+    for _ in range(max_iter):
+        # Escaped cells stop updating, so their count freezes
+        inside = z.real*z.real + z.imag*z.imag <= 4.0
+        z = cp.where(inside, z*z + c, z)
+        out += inside
+    
+    return cp.asnumpy(out)
+
 
 class VeryHardStressTest(Scene):
     """
@@ -15,6 +82,10 @@ class VeryHardStressTest(Scene):
     - Maximum computational load for extreme testing
     """
     
+    def setup(self):
+        # Seeded generator for every random draw (MANIM_STRESS_SEED, default 42)
+        self.rng = np.random.default_rng(int(os.getenv('MANIM_STRESS_SEED', 42)))
+    
     def construct(self):
         # Check if we're in test mode for fast verification
         test_mode = os.getenv('MANIM_TEST_MODE', 'false').lower() == 'true'
@@ -27,16 +98,13 @@ class VeryHardStressTest(Scene):
             self.wait(0.5)
             
             # Ultra-quick particle demo
-            particles = VGroup()
-            for i in range(15):  # Minimal particles
-                particle = Dot(radius=0.06, color=self.get_temperature_color(i))
-                angle = i * 2 * PI / 15
-                x = 1.5 * np.cos(angle)
-                y = 1.5 * np.sin(angle)
-                particle.move_to([x, y, 0])
-                particles.add(particle)
+            angles = np.arange(15) * 2 * PI / 15  # Minimal particles
+            particles = VGroup(*[
+                Dot(radius=0.06, color=color).move_to([1.5 * np.cos(angle), 1.5 * np.sin(angle), 0])
+                for angle, color in zip(angles, self.temperature_colors(15))
+            ])
             
-            self.play(LaggedStart(*[FadeIn(p) for p in particles], lag_ratio=0.03), run_time=1.5)
+            self.play(FadeIn(particles, lag_ratio=0.03), run_time=1.5)
             self.play(Rotate(particles, PI/2, run_time=1.5))
             
             # Quick color change
@@ -85,62 +153,63 @@ class VeryHardStressTest(Scene):
     def create_particle_universe(self):
         """Create a massive particle system with physics simulation"""
         # Create 500 particles
-        particles = VGroup()
-        velocities = []
+        # Random position in a large area
+        angles = self.rng.random(500) * 2 * PI
+        radii = self.rng.random(500) * 6
+        positions = np.column_stack([radii * np.cos(angles), radii * np.sin(angles)])
+        # Random velocity
+        velocities = (self.rng.random((500, 2)) - 0.5) * 2
         
-        for i in range(500):
-            particle = Dot(radius=0.03, color=self.get_temperature_color(i))
-            # Random position in a large area
-            angle = np.random.random() * 2 * PI
-            radius = np.random.random() * 6
-            x = radius * np.cos(angle)
-            y = radius * np.sin(angle)
-            particle.move_to([x, y, 0])
-            particles.add(particle)
-            
-            # Random velocity
-            vx = (np.random.random() - 0.5) * 2
-            vy = (np.random.random() - 0.5) * 2
-            velocities.append([vx, vy])
+        particles = VGroup(*[
+            Dot(radius=0.03, color=color).move_to([x, y, 0])
+            for (x, y), color in zip(positions, self.temperature_colors(500))
+        ])
         
         # Animate particles appearing
         self.play(
-            LaggedStart(*[FadeIn(particle) for particle in particles], 
-                       lag_ratio=0.005),
+            FadeIn(particles, lag_ratio=0.005),
             run_time=8
         )
         
-        # Physics simulation: gravitational attraction to center
-        for frame in range(120):  # 120 frames of physics
-            updates = []
-            for i, (particle, velocity) in enumerate(zip(particles, velocities)):
-                pos = particle.get_center()
-                # Gravity towards center
-                dist = np.linalg.norm(pos[:2])
-                if dist > 0.1:
-                    gravity = -0.01 / (dist + 0.1)
-                    velocities[i][0] += gravity * pos[0] / dist
-                    velocities[i][1] += gravity * pos[1] / dist
-                
-                # Update position
-                new_pos = pos + np.array([velocities[i][0], velocities[i][1], 0]) * 0.1
-                updates.append(particle.animate.move_to(new_pos))
-                
-                # Update color based on speed
-                speed = np.linalg.norm(velocities[i])
-                updates.append(particle.animate.set_color(self.get_speed_color(speed)))
+        # Physics simulation: gravitational attraction to center, precomputed
+        # as one snapshot per frame (trajectory[0] is the starting layout)
+        num_frames = 120
+        trajectory = np.empty((num_frames + 1, len(particles), 2))
+        trajectory[0] = positions
+        frame_colors = []
+        for frame in range(num_frames):
+            # Gravity towards center
+            dist = np.linalg.norm(positions, axis=1)
+            pulled = dist > 0.1
+            gravity = -0.01 / (dist[pulled] + 0.1)
+            velocities[pulled] += (gravity / dist[pulled])[:, None] * positions[pulled]
             
-            if updates:
-                self.play(*updates, run_time=0.1)
+            # Update position
+            positions += velocities * 0.1
+            trajectory[frame + 1] = positions
+            # Update colors based on speed
+            frame_colors.append(self.speed_colors(np.linalg.norm(velocities, axis=1)))
         
-        # Create explosion effect
-        explosion_animations = []
-        for i, particle in enumerate(particles):
-            direction = np.random.random(3) - 0.5
-            direction = direction / np.linalg.norm(direction) * 10
-            explosion_animations.append(
-                particle.animate.shift(direction).set_opacity(0)
-            )
+        def replay_physics(group, alpha):
+            # Blend between the snapshots either side of this point in the run
+            frame = min(int(alpha * num_frames), num_frames - 1)
+            blend = alpha * num_frames - frame
+            frame_positions = (1 - blend) * trajectory[frame] + blend * trajectory[frame + 1]
+            for particle, (x, y), color in zip(group, frame_positions, frame_colors[frame]):
+                particle.move_to([x, y, 0])
+                particle.set_color(color)
+        
+        # All 120 frames of physics (0.1s each) in a single animation
+        self.play(UpdateFromAlphaFunc(particles, replay_physics, rate_func=linear),
+                  run_time=num_frames * 0.1)
+        
+        # Create explosion effect: unit directions scaled to length 10
+        directions = self.rng.random((len(particles), 3)) - 0.5
+        directions *= 10 / np.linalg.norm(directions, axis=1, keepdims=True)
+        explosion_animations = [
+            particle.animate.shift(direction).set_opacity(0)
+            for particle, direction in zip(particles, directions)
+        ]
         
         self.play(*explosion_animations, run_time=4)
         self.remove(*particles)
@@ -151,48 +220,49 @@ class VeryHardStressTest(Scene):
         surfaces = VGroup()
         
         # Surface 1: Complex sine waves
-        surface1_points = VGroup()
-        for u in np.linspace(-3, 3, 20):
-            for v in np.linspace(-3, 3, 20):
-                z = np.sin(u**2 + v**2) * np.cos(u*v) * np.exp(-0.1*(u**2 + v**2))
-                point = Dot3D([u*0.5, v*0.5, z], radius=0.02)
-                point.set_color(self.get_height_color(z))
-                surface1_points.add(point)
+        u, v = np.meshgrid(np.linspace(-3, 3, 20), np.linspace(-3, 3, 20), indexing='ij')
+        r2 = u**2 + v**2  # Shared radial term
+        z = np.sin(r2) * np.cos(u*v) * np.exp(-0.1*r2)
+        coords = np.stack([u*0.5, v*0.5, z], axis=-1).reshape(-1, 3)
+        surface1_points = VGroup(*[
+            Dot3D(coord, radius=0.02, color=color)
+            for coord, color in zip(coords, self.height_colors(coords[:, 2]))
+        ])
         
         # Surface 2: Twisted torus
-        surface2_points = VGroup()
-        for i in range(50):
-            for j in range(25):
-                u = i * 2 * PI / 50
-                v = j * 2 * PI / 25
-                
-                # Twisted torus equations
-                R = 2
-                r = 0.5
-                x = (R + r * np.cos(v)) * np.cos(u)
-                y = (R + r * np.cos(v)) * np.sin(u)
-                z = r * np.sin(v) + 0.3 * np.sin(3*u)
-                
-                point = Dot3D([x*0.3, y*0.3, z*0.3], radius=0.02)
-                point.set_color(interpolate_color(BLUE, RED, i/50))
-                surface2_points.add(point)
+        i, j = np.meshgrid(np.arange(50), np.arange(25), indexing='ij')
+        u = i * 2 * PI / 50
+        v = j * 2 * PI / 25
+        
+        # Twisted torus equations
+        R = 2
+        r = 0.5
+        x = (R + r * np.cos(v)) * np.cos(u)
+        y = (R + r * np.cos(v)) * np.sin(u)
+        z = r * np.sin(v) + 0.3 * np.sin(3*u)
+        
+        coords = np.stack([x*0.3, y*0.3, z*0.3], axis=-1).reshape(-1, 3)
+        # The color only depends on the ring, so blend each of the 50 once
+        gradient = [interpolate_color(BLUE, RED, ring/50) for ring in range(50)]
+        surface2_points = VGroup(*[
+            Dot3D(coord, radius=0.02, color=gradient[ring])
+            for coord, ring in zip(coords, i.ravel())
+        ])
         
         # Animate surfaces appearing
         self.play(
-            LaggedStart(*[Create(point) for point in surface1_points], lag_ratio=0.002),
+            FadeIn(surface1_points, lag_ratio=self.lag_ratio_per_dot(surface1_points, 0.002)),
             run_time=10
         )
         
-        # Rotate surface 1
+        # Rotate surface 1 about UP then RIGHT, composed into a single rotation
+        angle, axis = composed_rotation((PI/2, UP), (PI/3, RIGHT))
         for _ in range(2):
-            self.play(
-                Rotate(surface1_points, PI/2, axis=UP, run_time=6),
-                Rotate(surface1_points, PI/3, axis=RIGHT, run_time=6),
-            )
+            self.play(Rotate(surface1_points, angle, axis=axis, run_time=6))
         
         # Add surface 2
         self.play(
-            LaggedStart(*[Create(point) for point in surface2_points], lag_ratio=0.002),
+            FadeIn(surface2_points, lag_ratio=self.lag_ratio_per_dot(surface2_points, 0.002)),
             run_time=10
         )
         
@@ -207,43 +277,33 @@ class VeryHardStressTest(Scene):
     
     def create_animated_fractals(self):
         """Create animated fractal patterns"""
-        # Mandelbrot-inspired pattern
-        fractal_points = VGroup()
+        # Mandelbrot-inspired pattern (simplified fractal calculation)
+        max_iter = 15
+        grid = mandel_grid_gpu if cp is not None else mandel_grid
+        iterations = grid(50, 50, max_iter, 1 / 12.5, 25, 25)
         
-        for i in range(50):
-            for j in range(50):
-                x = (i - 25) / 12.5
-                y = (j - 25) / 12.5
-                
-                # Simplified fractal calculation
-                c = complex(x, y)
-                z = 0
-                iterations = 0
-                max_iter = 15
-                
-                while abs(z) <= 2 and iterations < max_iter:
-                    z = z*z + c
-                    iterations += 1
-                
-                if iterations < max_iter:
-                    point = Dot([x*2, y*2, 0], radius=0.02)
-                    color_intensity = iterations / max_iter
-                    point.set_color(interpolate_color(BLACK, YELLOW, color_intensity))
-                    fractal_points.add(point)
+        fractal_points = VGroup(*[
+            Dot([(i - 25) / 12.5 * 2, (j - 25) / 12.5 * 2, 0], radius=0.02,
+                color=interpolate_color(BLACK, YELLOW, iterations[i, j] / max_iter))
+            for i, j in np.argwhere(iterations < max_iter)
+        ])
         
         # Animate fractal appearing
         self.play(
-            LaggedStart(*[FadeIn(point) for point in fractal_points], lag_ratio=0.01),
+            FadeIn(fractal_points, lag_ratio=0.01),
             run_time=10
         )
         
-        # Animate fractal morphing
+        # Animate fractal morphing, drawing each round's moves and colors in one batch;
+        # centers shadows the point positions so they are read back only once
+        num_points = len(fractal_points)
+        centers = np.array([point.get_center() for point in fractal_points])
         for _ in range(3):
-            morph_animations = []
-            for point in fractal_points:
-                new_pos = point.get_center() + (np.random.random(3) - 0.5) * 0.2
-                morph_animations.append(point.animate.move_to(new_pos))
-                morph_animations.append(point.animate.set_color(random_color()))
+            centers += (self.rng.random(centers.shape) - 0.5) * 0.2
+            morph_animations = [
+                point.animate.move_to(new_pos).set_color(color)
+                for point, new_pos, color in zip(fractal_points, centers, random_colors(num_points, self.rng))
+            ]
             
             self.play(*morph_animations, run_time=4)
         
@@ -252,39 +312,40 @@ class VeryHardStressTest(Scene):
     def create_concurrent_complex_animations(self):
         """Create multiple complex animations running concurrently"""
         # Create multiple groups of objects
-        group1 = VGroup()  # Spiraling circles
-        group2 = VGroup()  # Morphing polygons
-        group3 = VGroup()  # Oscillating lines
-        group4 = VGroup()  # Pulsating dots
+        # Copy prototypes instead of rebuilding each shape's Bezier points
+        circle_prototype = Circle(radius=0.1)
+        polygon_prototypes = {sides: RegularPolygon(n=sides, radius=0.2) for sides in range(3, 8)}
+        dot_prototype = Dot(radius=0.05)
         
         # Group 1: Spiraling circles
-        for i in range(25):
-            circle = Circle(radius=0.1, color=random_color())
-            angle = i * 2 * PI / 50
-            circle.move_to([2*np.cos(angle), 2*np.sin(angle), 0])
-            group1.add(circle)
+        angles = np.arange(25) * 2 * PI / 25
+        group1 = VGroup(*[
+            circle_prototype.copy().set_color(color).move_to([2*np.cos(angle), 2*np.sin(angle), 0])
+            for angle, color in zip(angles, random_colors(25, self.rng))
+        ])
         
         # Group 2: Morphing polygons
-        for i in range(10):
-            sides = np.random.randint(3, 8)
-            poly = RegularPolygon(n=sides, radius=0.2, color=random_color())
-            poly.move_to([np.random.uniform(-3, 3), np.random.uniform(-2, 2), 0])
-            group2.add(poly)
+        poly_sides = self.rng.integers(3, 8, size=10)
+        poly_positions = self.rng.uniform([-3, -2, 0], [3, 2, 0], size=(10, 3))
+        group2 = VGroup(*[
+            polygon_prototypes[sides].copy().set_color(color).move_to(position)
+            for sides, position, color in zip(poly_sides, poly_positions, random_colors(10, self.rng))
+        ])
         
-        # Group 3: Oscillating lines
-        for i in range(15):
-            line = Line(
-                start=[np.random.uniform(-4, 4), np.random.uniform(-3, 3), 0],
-                end=[np.random.uniform(-4, 4), np.random.uniform(-3, 3), 0],
-                color=random_color()
-            )
-            group3.add(line)
+        # Group 3: Oscillating lines; starts/ends shadow the line endpoints
+        starts = self.rng.uniform([-4, -3, 0], [4, 3, 0], size=(15, 3))
+        ends = self.rng.uniform([-4, -3, 0], [4, 3, 0], size=(15, 3))
+        group3 = VGroup(*[
+            Line(start=start, end=end, color=color)
+            for start, end, color in zip(starts, ends, random_colors(15, self.rng))
+        ])
         
         # Group 4: Pulsating dots
-        for i in range(30):
-            dot = Dot(radius=0.05, color=random_color())
-            dot.move_to([np.random.uniform(-5, 5), np.random.uniform(-3, 3), 0])
-            group4.add(dot)
+        dot_positions = self.rng.uniform([-5, -3, 0], [5, 3, 0], size=(30, 3))
+        group4 = VGroup(*[
+            dot_prototype.copy().set_color(color).move_to(position)
+            for position, color in zip(dot_positions, random_colors(30, self.rng))
+        ])
         
         # Create all groups
         self.play(
@@ -298,14 +359,17 @@ class VeryHardStressTest(Scene):
         # Run concurrent complex animations
         for cycle in range(5):
             animations = []
+            # One color draw per group for the whole cycle
+            circle_colors = random_colors(len(group1), self.rng)
+            dot_colors = random_colors(len(group4), self.rng)
             
-            # Group 1: Spiral motion
-            for i, circle in enumerate(group1):
-                angle = cycle * PI/5 + i * 2 * PI / len(group1)
-                radius = 2 + 0.5 * np.sin(cycle * PI/3)
-                new_pos = [radius*np.cos(angle), radius*np.sin(angle), 0]
-                animations.append(circle.animate.move_to(new_pos))
-                animations.append(circle.animate.set_color(random_color()))
+            # Group 1: Spiral motion, all circle angles in one array
+            angles = cycle * PI/5 + np.arange(len(group1)) * 2 * PI / len(group1)
+            radius = 2 + 0.5 * np.sin(cycle * PI/3)
+            xs = radius * np.cos(angles)
+            ys = radius * np.sin(angles)
+            for circle, x, y, color in zip(group1, xs, ys, circle_colors):
+                animations.append(circle.animate.move_to([x, y, 0]).set_color(color))
             
             # Group 2: Morphing and rotating
             for poly in group2:
@@ -313,60 +377,56 @@ class VeryHardStressTest(Scene):
                 animations.append(poly.animate.scale(1.2 if cycle % 2 == 0 else 0.8))
             
             # Group 3: Oscillating lines
-            for line in group3:
-                start = line.get_start()
-                end = line.get_end()
-                new_start = start + (np.random.random(3) - 0.5) * 0.5
-                new_end = end + (np.random.random(3) - 0.5) * 0.5
-                animations.append(line.animate.put_start_and_end_on(new_start, new_end))
+            starts += (self.rng.random(starts.shape) - 0.5) * 0.5
+            ends += (self.rng.random(ends.shape) - 0.5) * 0.5
+            for line, start, end in zip(group3, starts, ends):
+                animations.append(line.animate.put_start_and_end_on(start, end))
             
             # Group 4: Pulsating motion
-            for dot in group4:
+            for dot, color in zip(group4, dot_colors):
                 scale_factor = 1 + 0.5 * np.sin(cycle * PI/2)
-                animations.append(dot.animate.scale(scale_factor))
-                animations.append(dot.animate.set_color(random_color()))
+                animations.append(dot.animate.scale(scale_factor).set_color(color))
             
             self.play(*animations, run_time=3)
         
         # Final explosion of all objects
-        final_animations = []
         all_objects = [*group1, *group2, *group3, *group4]
-        for obj in all_objects:
-            direction = (np.random.random(3) - 0.5) * 20
-            final_animations.append(obj.animate.shift(direction).set_opacity(0))
+        directions = (self.rng.random((len(all_objects), 3)) - 0.5) * 20
+        final_animations = [
+            obj.animate.shift(direction).set_opacity(0)
+            for obj, direction in zip(all_objects, directions)
+        ]
         
         self.play(*final_animations, run_time=6)
         self.remove(*all_objects)
     
-    def get_temperature_color(self, index):
-        """Get color based on temperature simulation"""
-        colors = [BLUE, PURPLE, RED, ORANGE, YELLOW, WHITE]
-        return colors[index % len(colors)]
+    @staticmethod
+    def lag_ratio_per_dot(group, lag_ratio):
+        """Spread a per-dot lag ratio over every face of a group of Dot3Ds"""
+        # Group animations stagger each family member with points, i.e. each sphere face
+        return lag_ratio * len(group) / len(group.family_members_with_points())
     
-    def get_speed_color(self, speed):
-        """Get color based on speed"""
-        if speed < 0.1:
-            return BLUE
-        elif speed < 0.5:
-            return GREEN
-        elif speed < 1.0:
-            return YELLOW
-        else:
-            return RED
+    def temperature_colors(self, count):
+        """Get colors based on temperature simulation for count particles"""
+        return [TEMPERATURE_COLORS[i] for i in np.arange(count) % len(TEMPERATURE_COLORS)]
     
-    def get_height_color(self, height):
-        """Get color based on height value"""
-        if height < -0.5:
-            return DARK_BLUE
-        elif height < 0:
-            return BLUE
-        elif height < 0.5:
-            return GREEN
-        else:
-            return RED
+    def speed_colors(self, speeds):
+        """Get colors based on an array of speeds"""
+        return [SPEED_COLORS[i] for i in np.digitize(speeds, SPEED_BINS)]
+    
+    def height_colors(self, heights):
+        """Get colors based on an array of height values"""
+        return [HEIGHT_COLORS[i] for i in np.digitize(heights, HEIGHT_BINS)]
+
+def composed_rotation(*rotations):
+    """Combine (angle, axis) rotations, applied in order, into one (angle, axis)"""
+    combined = Rotation.identity()
+    for angle, axis in rotations:
+        combined = Rotation.from_rotvec(angle * normalize(np.asarray(axis, dtype=float))) * combined
+    rotvec = combined.as_rotvec()
+    angle = np.linalg.norm(rotvec)
+    return angle, rotvec / angle
 
-def random_color():
-    """Generate a random color"""
-    colors = [RED, BLUE, GREEN, YELLOW, PURPLE, ORANGE, PINK, GRAY, 
-              TEAL, MAROON, GOLD, LIGHT_BLUE, LIGHT_GREEN, LIGHT_PINK]
-    return np.random.choice(colors)
+def random_colors(count, rng):
+    """Generate count random colors with a single draw"""
+    return [COLORS[i] for i in rng.integers(len(COLORS), size=count)]